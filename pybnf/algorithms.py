@@ -17,6 +17,7 @@ from .printing import print0, print1, print2, PybnfError
 from .objective import ObjectiveCalculator, ConstraintCounter
 
 import logging
+import math
 import numpy as np
 import os
 import re
@@ -30,10 +31,33 @@ from tornado import gen
 from distributed.client import _wait
 from concurrent.futures._base import CancelledError
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 logger = logging.getLogger(__name__)
 
 
+def _pso_update(pos_p, vel_p, best_p, gbest, w, c1, c2, r1, r2):
+    """
+    Updates one particle's velocity in place, given its position, its own best, and the swarm's global best
+    (all 1D float64 arrays in PSO space).
+    """
+    vel_p[:] = w * vel_p + c1 * r1 * (best_p - pos_p) + c2 * r2 * (gbest - pos_p)
+
+
+if njit is not None:
+    # With numba available, fuse the update into a single loop with no temporaries. For the small vectors
+    # involved here (one row per particle), the numpy expression above spends most of its time in ufunc
+    # dispatch rather than arithmetic.
+    @njit(cache=True, fastmath=True)
+    def _pso_update(pos_p, vel_p, best_p, gbest, w, c1, c2, r1, r2):
+        for i in range(vel_p.shape[0]):
+            vel_p[i] = w * vel_p[i] + c1 * r1[i] * (best_p[i] - pos_p[i]) + c2 * r2[i] * (gbest[i] - pos_p[i])
+
+
 class Result(object):
     """
     Container for the results of a single evaluation in the fitting algorithm
@@ -137,13 +161,19 @@ class FailedSimulation(Result):
         return
 
 
-def run_job(j, debug=False, failed_logs_dir=''):
+def run_job(j, debug=False, failed_logs_dir='', models=None, calc=None):
     """
     Runs the Job j.
     This function is passed to Dask instead of j.run_simulation because if you pass j.run_simulation, Dask leaks memory
     associated with j.
+    The models and the ObjectiveCalculator may be passed separately as scattered futures, so that these (potentially
+    large) objects are shipped to each worker only once per run instead of being pickled into every Job.
     """
     try:
+        if models is not None:
+            j.models = models
+        if calc is not None:
+            j.calc_future = calc
         return j.run_simulation(debug, failed_logs_dir)
     except RuntimeError as e:
         # Catch the error for running out of threads here - it's the only place outside dask where we can catch it.
@@ -169,17 +199,19 @@ class Job:
         """
         Instantiates a Job
 
-        :param models: The models to evaluate
-        :type models: list of Model instances
+        :param models: The models to evaluate. May be None if the model list is supplied separately to run_job()
+        (e.g. as a scattered future)
+        :type models: list of Model instances or None
         :param params: The parameter set with which to evaluate the model
         :type params: PSet
         :param job_id: Job identification; also the folder name that the job gets saved to
         :type job_id: str
         :param output_dir path to the directory where I should create my simulation folder
         :type output_dir: str
-        :param calc_future: Future for an ObjectiveCalculator containing the objective function and experimental data,
-        which we can use to calculate the objective value.
-        :type calc_future: Future
+        :param calc_future: ObjectiveCalculator containing the objective function and experimental data, which we can
+        use to calculate the objective value. Usually None at construction; run_job() fills it in on the worker from
+        a future scattered once per run, so the experimental data is not pickled into every Job.
+        :type calc_future: ObjectiveCalculator or None
         :param norm_settings: Config value for 'normalization': a string representing the normalization type, a dict
         mapping exp files to normalization type, or None
         :type norm_settings: Union[str, dict, NoneType]
@@ -286,7 +318,7 @@ class Job:
                     print0('User-defined post-processing script failed')
                     res.score = np.inf
                 else:
-                    res.score = self.calc_future.result().evaluate_objective(res.simdata, show_warnings=self.show_warnings)
+                    res.score = self.calc_future.evaluate_objective(res.simdata, show_warnings=self.show_warnings)
                     if res.score is None:
                         res.score = np.inf
                         logger.warning('Simulation corresponding to Result %s contained NaNs or Infs' % res.name)
@@ -471,6 +503,7 @@ class Algorithm(object):
         self.bootstrap_number = None
         self.best_fit_obj = None
         self.calc_future = None  # Created during Algorithm.run()
+        self.model_future = None  # Created during Algorithm.run()
         self.refine = False
 
     def reset(self, bootstrap):
@@ -514,7 +547,7 @@ class Algorithm(object):
         :param k:
         :return:
         """
-        return k not in set(['trajectory', 'calc_future'])
+        return k not in set(['trajectory', 'calc_future', 'model_future'])
 
     def __getstate__(self):
         return {k: v for k, v in self.__dict__.items() if self.should_pickle(k)}
@@ -623,7 +656,14 @@ class Algorithm(object):
         """
         Adds the information from a Result to the Trajectory instance
         """
-        # Evaluate objective if it wasn't done on workers.
+        self.score_result(res)
+        logger.info('Adding Result %s to Trajectory with score %.4f' % (res.name, res.score))
+        self.trajectory.add(res.pset, res.score, res.name)
+
+    def score_result(self, res):
+        """
+        Ensures a Result has an objective function value, evaluating it here if that wasn't done on the workers
+        """
         if res.score is None:  # Check if the objective wasn't evaluated on the workers
             res.normalize(self.config.config['normalization'])
             # Do custom postprocessing, if any
@@ -641,8 +681,6 @@ class Algorithm(object):
                 logger.warning('Simulation corresponding to Result %s contained NaNs or Infs' % res.name)
                 logger.warning('Discarding Result %s as having an infinite objective function value' % res.name)
                 print1('Simulation data in Result %s has NaN or Inf values.  Discarding this parameter set' % res.name)
-        logger.info('Adding Result %s to Trajectory with score %.4f' % (res.name, res.score))
-        self.trajectory.add(res.pset, res.score, res.name)
 
     def random_pset(self):
         """
@@ -656,6 +694,20 @@ class Algorithm(object):
             pset_vars.append(var.sample_value())
         return PSet(pset_vars)
 
+    def random_psets(self, n):
+        """
+        Generates n random PSets based on the distributions and bounds of each parameter
+
+        Unlike n calls of random_pset(), this draws the random values for each parameter in a single
+        vectorized call, avoiding n separate trips into numpy's random machinery per variable.
+
+        :param n: Number of psets to generate
+        :return: list of PSets
+        """
+        logger.debug("Generating %i randomly distributed PSets" % n)
+        columns = [var.sample_values(n) for var in self.variables]
+        return [PSet([col[i] for col in columns]) for i in range(n)]
+
     def random_latin_hypercube_psets(self, n):
         """
         Generates n random PSets with a latin hypercube distribution
@@ -710,6 +762,9 @@ class Algorithm(object):
             self.job_id_counter += 1
             job_id = 'sim_%i' % self.job_id_counter
         logger.debug('Creating Job %s' % job_id)
+        # If the model list was scattered to the workers, leave it out of the Job and let run_job() fill it in
+        # worker-side, so it isn't re-pickled into every task.
+        models = None if self.model_future is not None else self.model_list
         if self.config.config['smoothing'] > 1:
             # Create multiple identical Jobs for use with smoothing
             newjobs = []
@@ -719,7 +774,7 @@ class Algorithm(object):
                 newnames.append(thisname)
                 # calc_future is supposed to be None here - the workers don't have enough info to calculate the
                 # objective on their own
-                newjobs.append(Job(self.model_list, params, thisname,
+                newjobs.append(Job(models, params, thisname,
                                    self.sim_dir, self.config.config['wall_time_sim'], self.calc_future,
                                    self.config.config['normalization'], dict(),
                                    bool(self.config.config['delete_old_files'])))
@@ -748,8 +803,9 @@ class Algorithm(object):
             return newjobs
         else:
             # Create a single job
-            return [Job(self.model_list, params, job_id,
-                    self.sim_dir, self.config.config['wall_time_sim'], self.calc_future,
+            # calc_future is left as None here - run_job() supplies the scattered ObjectiveCalculator on the worker
+            return [Job(models, params, job_id,
+                    self.sim_dir, self.config.config['wall_time_sim'], None,
                     self.config.config['normalization'], self.config.postprocessing,
                     bool(self.config.config['delete_old_files']))]
 
@@ -855,78 +911,107 @@ class Algorithm(object):
         else:
             self.calc_future = None
 
+        if self.config.config['parallelize_models'] == 1:
+            # Ship the model list to the workers once, instead of pickling it into every Job.
+            # With parallelize_models, each Job carries its own slice of the model list instead.
+            [self.model_future] = client.scatter([self.model_list], broadcast=True)
+        else:
+            self.model_future = None
+
         jobs = []
         pending = dict()  # Maps pending futures to tuple (PSet, job_id).
         for p in psets:
             jobs += self.make_job(p)
         jobs[0].show_warnings = True  # For only the first job submitted, show warnings if exp data is unused.
         logger.info('Submitting initial set of %d Jobs' % len(jobs))
-        futures = []
-        for job in jobs:
-            f = client.submit(run_job, job, True, self.failed_logs_dir)
-            futures.append(f)
+        # Submit the entire set in one scheduler transaction instead of one RPC per job
+        futures = client.map(run_job, jobs, debug=True, failed_logs_dir=self.failed_logs_dir,
+                             models=self.model_future, calc=self.calc_future)
+        for job, f in zip(jobs, futures):
             pending[f] = (job.params, job.job_id)
         pool = custom_as_completed(futures, with_results=True, raise_errors=False)
-        backed_up = True
-        while True:
-            if sim_count % backup_every == 0 and not backed_up:
+        next_backup = backup_every  # Back up when sim_count reaches this threshold
+        stop = False
+        # Drain completed futures in batches, so a burst of cheap simulations costs one scheduler round trip
+        # instead of one per result.
+        for batch in pool.batches():
+            # sim_count advances by a whole batch at a time, so compare against a threshold rather than
+            # testing for an exact multiple of backup_every, which a batch could step over.
+            if sim_count >= next_backup:
                 self.backup(set([pending[fut][0] for fut in pending]))
-                backed_up = True
-            f, res = next(pool)
-            if isinstance(res, DaskError):
-                if isinstance(res.error, PybnfError):
-                    raise res.error  # User-targeted error should be raised instead of skipped
-                logger.error('Job failed with an exception')
-                logger.error(res.traceback)
-                res = FailedSimulation(pending[f][0], pending[f][1], 3)
-            # Handle if this result is one of multiple instances for smoothing
-            del pending[f]
-            if self.config.config['smoothing'] > 1 or self.config.config['parallelize_models'] > 1:
-                group = self.job_group_dir.pop(res.name)
-                done = group.job_finished(res)
-                if not done:
-                    continue
-                res = group.average_results()
-            sim_count += 1
-            backed_up = False
-            if isinstance(res, FailedSimulation):
-                if res.fail_type >= 1:
-                    self.fail_count += 1
-                tb = '\n'+res.traceback if res.fail_type == 1 else ''
-
-                logger.debug('Job %s failed with code %d%s' % (res.name, res.fail_type, tb))
-                if res.fail_type >= 1:
-                    print1('Job %s failed' % res.name)
+                next_backup = sim_count - sim_count % backup_every + backup_every
+            new_psets = []
+            completed = []
+            for f, res in batch:
+                if isinstance(res, DaskError):
+                    if isinstance(res.error, PybnfError):
+                        raise res.error  # User-targeted error should be raised instead of skipped
+                    logger.error('Job failed with an exception')
+                    logger.error(res.traceback)
+                    res = FailedSimulation(pending[f][0], pending[f][1], 3)
+                # Handle if this result is one of multiple instances for smoothing
+                del pending[f]
+                # Drop our reference to the future so the scheduler can forget the completed task. Otherwise a
+                # long run accumulates metadata for every finished job on the scheduler.
+                f.release()
+                if self.config.config['smoothing'] > 1 or self.config.config['parallelize_models'] > 1:
+                    group = self.job_group_dir.pop(res.name)
+                    done = group.job_finished(res)
+                    if not done:
+                        continue
+                    res = group.average_results()
+                sim_count += 1
+                if isinstance(res, FailedSimulation):
+                    if res.fail_type >= 1:
+                        self.fail_count += 1
+                    tb = '\n'+res.traceback if res.fail_type == 1 else ''
+
+                    logger.debug('Job %s failed with code %d%s' % (res.name, res.fail_type, tb))
+                    if res.fail_type >= 1:
+                        print1('Job %s failed' % res.name)
+                    else:
+                        print1('Job %s timed out' % res.name)
+                    if self.success_count == 0 and self.fail_count >= 100:
+                        raise PybnfError('Aborted because all jobs are failing',
+                                         'Your simulations are failing to run. Logs from failed simulations are saved '
+                                         'in the FailedSimLogs directory. For help troubleshooting this error, refer '
+                                         'to '
+                                         'https://pybnf.readthedocs.io/en/latest/troubleshooting.html#failed-simulations')
                 else:
-                    print1('Job %s timed out' % res.name)
-                if self.success_count == 0 and self.fail_count >= 100:
-                    raise PybnfError('Aborted because all jobs are failing',
-                                     'Your simulations are failing to run. Logs from failed simulations are saved in '
-                                     'the FailedSimLogs directory. For help troubleshooting this error, refer to '
-                                     'https://pybnf.readthedocs.io/en/latest/troubleshooting.html#failed-simulations')
-            else:
-                self.success_count += 1
-                logger.debug('Job %s complete' % res.name)
-
-            self.add_to_trajectory(res)
-            if res.score < self.config.config['min_objective']:
-                logger.info('Minimum objective value achieved')
-                print1('Minimum objective value achieved')
-                break
-            response = self.got_result(res)
-            if response == 'STOP':
-                self.best_fit_obj = self.trajectory.best_score()
-                logger.info("Stop criterion satisfied with objective function value of %s" % self.best_fit_obj)
-                print1("Stop criterion satisfied with objective function value of %s" % self.best_fit_obj)
+                    self.success_count += 1
+                    logger.debug('Job %s complete' % res.name)
+
+                self.score_result(res)
+                logger.info('Adding Result %s to Trajectory with score %.4f' % (res.name, res.score))
+                completed.append(res)
+            # Insert the whole batch into the trajectory in one call
+            self.trajectory.add_many([(res.pset, res.score, res.name) for res in completed])
+            for res in completed:
+                if res.score < self.config.config['min_objective']:
+                    logger.info('Minimum objective value achieved')
+                    print1('Minimum objective value achieved')
+                    stop = True
+                    break
+                response = self.got_result(res)
+                if response == 'STOP':
+                    self.best_fit_obj = self.trajectory.best_score()
+                    logger.info("Stop criterion satisfied with objective function value of %s" % self.best_fit_obj)
+                    print1("Stop criterion satisfied with objective function value of %s" % self.best_fit_obj)
+                    stop = True
+                    break
+                new_psets += response
+            if stop:
                 break
-            else:
-                new_futures = []
-                for ps in response:
-                    new_js = self.make_job(ps)
-                    for new_j in new_js:
-                        new_f = client.submit(run_job, new_j, (debug or self.fail_count < 10), self.failed_logs_dir)
-                        pending[new_f] = (ps, new_j.job_id)
-                        new_futures.append(new_f)
+            if new_psets:
+                # Resubmit everything generated by this batch of results in a single transaction
+                new_jobs = []
+                for ps in new_psets:
+                    new_jobs += self.make_job(ps)
+                new_futures = client.map(run_job, new_jobs, debug=(debug or self.fail_count < 10),
+                                         failed_logs_dir=self.failed_logs_dir, models=self.model_future,
+                                         calc=self.calc_future)
+                for new_j, new_f in zip(new_jobs, new_futures):
+                    pending[new_f] = (new_j.params, new_j.job_id)
                 logger.debug('Submitting %d new Jobs' % len(new_futures))
                 pool.update(new_futures)
 
@@ -1060,6 +1145,10 @@ class ParticleSwarm(Algorithm):
 
         super(ParticleSwarm, self).__init__(config)
 
+        # Freeze the variable list as a tuple - it is iterated on every result, and the tuple makes it clear
+        # the ordering (and thus the column layout of the swarm arrays) never changes mid-run.
+        self.variables = tuple(self.variables)
+
         # This default value gets special treatment because if missing, it should take the value of particle_weight,
         # disabling the adaptive weight change entirely.
         if 'particle_weight_final' not in self.config.config:
@@ -1085,24 +1174,70 @@ class ParticleSwarm(Algorithm):
         self.nv = 0  # Counter that controls the current weight. Counts number of "unproductive" iterations.
         self.num_evals = 0  # Counter for the total number of results received
 
-        # Initialize storage for the swarm data
-        self.swarm = []  # List of lists of the form [PSet, velocity]. Velocity is stored as a dict with the same keys
-        # as PSet
-        self.pset_map = dict()  # Maps each PSet to it s particle number, for easy lookup.
-        self.bests = [[None, np.inf]] * self.num_particles  # The best result for each particle: list of the
-        # form [PSet, objective]
-        self.global_best = [None, np.inf]  # The best result for the whole swarm
-        self.last_best = np.inf
+        # Generator for the stochastic terms of the velocity update. The Generator API (PCG64) is faster per
+        # draw than the legacy np.random global state, and keeps the swarm's randomness self-contained.
+        self.rng = np.random.default_rng()
+
+        # Score of every evaluation in arrival order, for post-run analysis of convergence. max_evals is known
+        # up front, so this is one contiguous allocation; slots never reached stay NaN.
+        self.score_history = np.full(self.max_evals, np.nan)
+        # Current inertia weight. Only a function of nv, which changes at pseudoflight boundaries, so it is
+        # recomputed there rather than on every result.
+        self.w = self.w0
+
+        # Initialize storage for the swarm data.
+        # Positions and velocities are stored as 2D arrays of shape (num_particles, num_variables), so the
+        # per-particle update in got_result() is a single vectorized expression instead of a Python loop.
+        # Positions are in "PSO space": the log10 of the value for variables moving in log space, and the plain
+        # value otherwise, matching the space in which FreeParameter.diff() and add() operate.
+        self.pos = None  # ndarray of particle positions, allocated in start_run()
+        self.vel = None  # ndarray of particle velocities, allocated in start_run()
+        self.particles = []  # Current PSet for each particle
+        # The best point seen by each particle, as a position row and its objective value.
+        # (The old list-of-[PSet, objective] layout built with [[None, inf]] * n aliased a single inner list
+        # across all particles - it only worked because slots were reassigned, never mutated.)
+        self.bests_pos = np.full((self.num_particles, len(self.variables)), np.nan)
+        self.bests_score = np.full(self.num_particles, np.inf)
+        self.bests_pset = [None] * self.num_particles  # The PSet behind each row of bests_pos
+        # The best result for the whole swarm. Refreshed with a single argmin over bests_score at each
+        # pseudoflight boundary (the synchronous PSO variant), not on every result.
+        self.global_best = [None, math.inf]
+        self.global_best_pos = None  # Position row for global_best, kept in sync with it
+        self.last_best = math.inf
+
+        # Box constraints for each variable, in the same space as self.pos (log10 for log-space variables).
+        # Unbounded variables get (-inf, inf) so they never trigger the reflection check.
+        with np.errstate(divide='ignore'):
+            self.lower = np.array([np.log10(v.lower_bound) if v.log_space else v.lower_bound
+                                   for v in self.variables])
+            self.upper = np.array([np.log10(v.upper_bound) if v.log_space else v.upper_bound
+                                   for v in self.variables])
 
     def reset(self, bootstrap=None):
         super(ParticleSwarm, self).reset(bootstrap)
         self.nv = 0
         self.num_evals = 0
-        self.swarm = []
-        self.pset_map = dict()
-        self.bests = [[None, np.inf]] * self.num_particles
-        self.global_best = [None, np.inf]
-        self.last_best = np.inf
+        self.w = self.w0
+        self.score_history = np.full(self.max_evals, np.nan)
+        self.pos = None
+        self.vel = None
+        self.particles = []
+        self.bests_pos = np.full((self.num_particles, len(self.variables)), np.nan)
+        self.bests_score = np.full(self.num_particles, np.inf)
+        self.bests_pset = [None] * self.num_particles
+        self.global_best = [None, math.inf]
+        self.global_best_pos = None
+        self.last_best = math.inf
+
+    def _pset_to_array(self, pset):
+        """
+        Converts a PSet to a 1D array in the same space as self.pos (log10 values for log-space variables)
+
+        :param pset: The PSet to convert
+        :type pset: PSet
+        :return: 1D ndarray of length len(self.variables)
+        """
+        return np.array([np.log10(pset[v.name]) if v.log_space else pset[v.name] for v in self.variables])
 
     def start_run(self):
         """
@@ -1115,19 +1250,19 @@ class ParticleSwarm(Algorithm):
         if self.config.config['initialization'] == 'lh':
             new_params_list = self.random_latin_hypercube_psets(self.num_particles)
         else:
-            new_params_list = [self.random_pset() for i in range(self.num_particles)]
+            new_params_list = self.random_psets(self.num_particles)
 
         for i in range(len(new_params_list)):
             p = new_params_list[i]
             p.name = 'iter0p%i' % i
 
-            # As suggested by Engelbrecht 2012, set all initial velocities to 0
-            new_velocity = dict({v.name: 0. for v in self.variables})
+            self.particles.append(p)
 
-            self.swarm.append([p, new_velocity])
-            self.pset_map[p] = len(self.swarm)-1  # Index of the newly added PSet.
+        self.pos = np.array([self._pset_to_array(p) for p in self.particles])
+        # As suggested by Engelbrecht 2012, set all initial velocities to 0
+        self.vel = np.zeros((self.num_particles, len(self.variables)))
 
-        return [particle[0] for particle in self.swarm]
+        return list(self.particles)
 
     def got_result(self, res):
         """
@@ -1141,23 +1276,51 @@ class ParticleSwarm(Algorithm):
         score = res.score
 
         self.num_evals += 1
+        if self.num_evals <= self.max_evals:  # In-flight jobs can still deliver results after the last one counted
+            self.score_history[self.num_evals - 1] = score
+
+        # The particle number and iteration are encoded in the name we gave the PSet ('iter##p##'), and the name
+        # travels with the Job and Result. Reading it back here routes the result in O(1), with no PSet hashing.
+        iternum, p = (int(x) for x in re.search('iter([0-9]+)p([0-9]+)', paramset.name).groups())
+
+        # Update this particle's own best if needed.
+        # The evaluated point is still held in self.pos[p] - nothing moves a particle between submitting its job
+        # and receiving the result - so there is no need to convert the returned PSet back into a row.
+        # The swarm-wide best is not touched here; it is refreshed once per pseudoflight below, so every particle
+        # in a pseudoflight is attracted toward the same point (the synchronous PSO variant).
+        if score <= self.bests_score[p]:
+            self.bests_pos[p] = self.pos[p]
+            self.bests_score[p] = score
+            self.bests_pset[p] = paramset
+            if self.num_evals <= self.num_particles and score <= self.global_best[1]:
+                # During the first pseudoflight no boundary has set the swarm-wide best yet, so seed it as
+                # results arrive - the velocity updates below need a global best to be attracted toward.
+                self.global_best = [paramset, score]
+                self.global_best_pos = self.pos[p].copy()
 
         if self.num_evals % self.num_particles == 0:
+            # End of one "pseudoflight" - refresh the swarm-wide best from the particle bests in one argmin.
+            best = int(self.bests_score.argmin())
+            self.global_best = [self.bests_pset[best], self.bests_score[best]]
+            self.global_best_pos = self.bests_pos[best].copy()
             if (self.num_evals / self.num_particles) % 10 == 0:
                 print1('Completed %i of %i simulations' % (self.num_evals, self.max_evals))
             else:
                 print2('Completed %i of %i simulations' % (self.num_evals, self.max_evals))
             print2('Current best score: %f' % self.global_best[1])
-            # End of one "pseudoflight", check if it was productive.
-            if (self.last_best != np.inf and
-                    np.abs(self.last_best - self.global_best[1]) <
+            # Check if the pseudoflight was productive.
+            # Plain Python abs() and math.inf here - this runs per result, and the numpy scalar path costs a full
+            # ufunc dispatch for a single float.
+            if (self.last_best != math.inf and
+                    abs(self.last_best - self.global_best[1]) <
                     self.absolute_tol + self.relative_tol * self.last_best):
                 self.nv += 1
+                self.w = self.w0 + (self.wf - self.w0) * self.nv / (self.nv + self.nmax)
             self.last_best = self.global_best[1]
 
             # Check stop criterion
             if self.config.config['v_stop'] > 0:
-                max_speed = max([abs(v) for p in self.swarm for v in p[1].values()])
+                max_speed = np.max(np.abs(self.vel))
                 if max_speed < self.config.config['v_stop']:
                     logger.info('Stopping particle swarm because the max speed is %s' % max_speed)
                     return 'STOP'
@@ -1165,50 +1328,26 @@ class ParticleSwarm(Algorithm):
         if self.num_evals % self.output_every == 0:
             self.output_results()
 
-        p = self.pset_map.pop(paramset)  # Particle number
-
-        # Update best scores if needed.
-        if score <= self.bests[p][1]:
-            self.bests[p] = [paramset, score]
-            if score <= self.global_best[1]:
-                self.global_best = [paramset, score]
-
         # Update own position and velocity
         # The order matters - updating velocity first seems to make the best use of our current info.
-        w = self.w0 + (self.wf - self.w0) * self.nv / (self.nv + self.nmax)
-        self.swarm[p][1] = \
-            {v.name:
-                w * self.swarm[p][1][v.name] +
-                self.c1 * np.random.random() * self.bests[p][0].get_param(v.name).diff(self.swarm[p][0].get_param(v.name)) +
-                self.c2 * np.random.random() * self.global_best[0].get_param(v.name).diff(self.swarm[p][0].get_param(v.name))
-            for v in self.variables}
+        # Both stochastic terms come from one draw
+        r = self.rng.random((2, len(self.variables)))
+        _pso_update(self.pos[p], self.vel[p], self.bests_pos[p], self.global_best_pos,
+                    self.w, self.c1, self.c2, r[0], r[1])
 
         # Manually check to determine if reflection occurred (i.e. attempted assigning of variable outside its bounds)
         # If so, update based on reflection protocol and set velocity to 0
-        new_vars = []
-        for v in self.swarm[p][0]:
-            new_vars.append(v.add(self.swarm[p][1][v.name]))
-            if v.log_space:
-                new_val = 10.**(np.log10(v.value) + self.swarm[p][1][v.name])
-            else:
-                new_val = v.value + self.swarm[p][1][v.name]
-            if new_val < v.lower_bound or v.upper_bound < new_val:
-                self.swarm[p][1][v.name] = 0.0
+        candidate = self.pos[p] + self.vel[p]
+        out_of_bounds = (candidate < self.lower) | (candidate > self.upper)
+        get_param = self.particles[p].get_param
+        new_vars = [get_param(v.name).add(dv) for v, dv in zip(self.variables, self.vel[p])]
+        self.vel[p][out_of_bounds] = 0.0
 
         new_pset = PSet(new_vars)
-        self.swarm[p][0] = new_pset
-
-        # This will cause a crash if new_pset happens to be the same as an already running pset in pset_map.
-        # This could come up in practice if all parameters have hit a box constraint.
-        # As a simple workaround, perturb the parameters slightly
-        while new_pset in self.pset_map:
-            new_pset = PSet([v.add_rand(-1e-6, 1e-6) for v in self.swarm[p][0]])
-
-        self.pset_map[new_pset] = p
+        self.particles[p] = new_pset
+        self.pos[p] = self._pset_to_array(new_pset)
 
-        # Set the new name: the old pset name is iter##p##
-        # Extract the iter number
-        iternum = int(re.search('iter([0-9]+)', paramset.name).groups()[0])
+        # Set the new name based on the old pset name, iter##p##
         new_pset.name = 'iter%ip%i' % (iternum+1, p)
 
         # Check for stopping criteria
@@ -1218,7 +1357,10 @@ class ParticleSwarm(Algorithm):
         return [new_pset]
 
     def add_iterations(self, n):
-        self.max_evals += n * self.config.config['population_size']
+        extra_evals = n * self.config.config['population_size']
+        self.max_evals += extra_evals
+        # Keep the score history sized to match the extended run
+        self.score_history = np.concatenate([self.score_history, np.full(extra_evals, np.nan)])
 
 
 class DifferentialEvolutionBase(Algorithm):
@@ -78,8 +78,11 @@ class Cluster:
             self.client.run(init_logging, log_prefix, debug, log_level_name)
             self.local = True
         else:
-            logger.info('Creating a local client with default parallel count')
-            self.client = Client()
+            logger.info('Creating a local client with one single-threaded worker per CPU')
+            # Simulations are CPU-bound (subprocess or GIL-holding library calls), so one single-threaded
+            # worker process per core beats dask's default layout of a few multi-threaded workers.
+            lc = LocalCluster(n_workers=cpu_count(), threads_per_worker=1)
+            self.client = Client(lc)
             self.client.run(init_logging, log_prefix, debug, log_level_name)
             self.local = True
 
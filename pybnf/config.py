@@ -584,40 +584,43 @@ class Configuration(object):
         :return: a list of FreeParameter instances
         """
         variables = []
-        for k in self.config.keys():
-            if isinstance(k, tuple):
-                if re.search('var$', k[0]):
-                    if self.config['fit_type'] == 'sim' and k[0] not in ('var', 'logvar'):
-                        raise PybnfError('Invalid Simplex variable type %s' % k[0],
-                               "You've specified the Simplex algorithm (fit_type = sim), "
-                               "but defined variable %s with the %s keyword.\n"
-                               "For Simplex, you must instead define a single initial value for each variable\n"
-                               "using the var or logvar keyword (e.g. var=%s 42 )" % (k[1], k[0], k[1]))
-
-                    if self.config['fit_type'] != 'sim' and k[0] in ('var', 'logvar'):
-                        raise PybnfError('Tried to use Simplex variable type %s in another algorithm.' % k[0],
-                               "You've specified variable %s with keyword %s, but that keyword "
-                               "is only to be used with the Simplex algorithm (fit_type = sim)\n"
-                               "Valid keywords for other algorithms are: uniform_var, normal_var, \n"
-                               "lognormal_var, loguniform_var." % (k[1], k[0]))
-
-                    if k[0] in ('var', 'logvar'):
-                        # 2nd number (step size) may be absent, must fill in appropriately
-                        if len(self.config[k]) >= 2:
-                            stepsize = self.config[k][1] # easy, it was right there
-                        else:
-                            stepsize = None  # Will sort out within SimplexAlgorithm
-                        free_param = FreeParameter(k[1], k[0], self.config[k][0], stepsize)
+        # Sort by variable name so the ordering is deterministic across runs, instead of depending on the order
+        # the keys happened to be inserted into the config dict. Everything downstream that pairs variables with
+        # fixed indices (e.g. the particle swarm position arrays) relies on this ordering being stable.
+        var_keys = sorted((k for k in self.config.keys() if isinstance(k, tuple)), key=lambda k: k[1])
+        for k in var_keys:
+            if re.search('var$', k[0]):
+                if self.config['fit_type'] == 'sim' and k[0] not in ('var', 'logvar'):
+                    raise PybnfError('Invalid Simplex variable type %s' % k[0],
+                           "You've specified the Simplex algorithm (fit_type = sim), "
+                           "but defined variable %s with the %s keyword.\n"
+                           "For Simplex, you must instead define a single initial value for each variable\n"
+                           "using the var or logvar keyword (e.g. var=%s 42 )" % (k[1], k[0], k[1]))
+
+                if self.config['fit_type'] != 'sim' and k[0] in ('var', 'logvar'):
+                    raise PybnfError('Tried to use Simplex variable type %s in another algorithm.' % k[0],
+                           "You've specified variable %s with keyword %s, but that keyword "
+                           "is only to be used with the Simplex algorithm (fit_type = sim)\n"
+                           "Valid keywords for other algorithms are: uniform_var, normal_var, \n"
+                           "lognormal_var, loguniform_var." % (k[1], k[0]))
+
+                if k[0] in ('var', 'logvar'):
+                    # 2nd number (step size) may be absent, must fill in appropriately
+                    if len(self.config[k]) >= 2:
+                        stepsize = self.config[k][1] # easy, it was right there
                     else:
-                        if len(self.config[k]) == 3:
-                            free_param = FreeParameter(k[1], k[0], self.config[k][0], self.config[k][1],
-                                                           bounded=self.config[k][2])
-                        else:
-                            free_param = FreeParameter(k[1], k[0], self.config[k][0], self.config[k][1])
+                        stepsize = None  # Will sort out within SimplexAlgorithm
+                    free_param = FreeParameter(k[1], k[0], self.config[k][0], stepsize)
+                else:
+                    if len(self.config[k]) == 3:
+                        free_param = FreeParameter(k[1], k[0], self.config[k][0], self.config[k][1],
+                                                       bounded=self.config[k][2])
+                    else:
+                        free_param = FreeParameter(k[1], k[0], self.config[k][0], self.config[k][1])
 
-                    logger.debug('Adding parameter %s with bounds [%s, %s]' %
-                                 (free_param.name, free_param.lower_bound, free_param.upper_bound))
-                    variables.append(free_param)
+                logger.debug('Adding parameter %s with bounds [%s, %s]' %
+                             (free_param.name, free_param.lower_bound, free_param.upper_bound))
+                variables.append(free_param)
         logger.info('Loaded variables')
         return variables
 
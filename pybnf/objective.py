@@ -124,63 +124,68 @@ class SummationObjective(ObjectiveFunction):
             raise PybnfError('The independent variable "%s" in your exp file was not found in the simulation data.'
                              % indvar)
 
-        func_value = 0.0
-        # Iterate through rows of experimental data
-        for rownum in range(exp_data.data.shape[0]):
-
-            if self.rounding == 0:
-                # Figure out the corresponding row number in the simulation data
-                # Find the row number of sim_data column 0 that is almost equal to exp_data[rownum, 0]
-                sim_row = np.argmax(np.isclose(sim_data[indvar], exp_data.data[rownum, 0], atol=0.))
-                # If no such column existed, sim_row will come out as 0; need to check for this and skip if it happened
-                if sim_row == 0 and not np.isclose(sim_data[indvar][0], exp_data.data[rownum, 0], atol=0.):
-                    warnstr = indvar + str(exp_data.data[rownum, 0])  # An identifier so we only print the warning once
-                    if show_warnings and warnstr not in self.warned:
-                        print1("Warning: Ignored " + indvar + " " + str(exp_data.data[rownum, 0]) +
-                               " because that " + indvar + " was not in the simulation data.")
-                        self.warned.add(warnstr)
-                    continue
-            elif self.rounding == 1:
-                # Take the closest row to the exp data
-                sim_row = np.argmin(abs(sim_data[indvar] - exp_data.data[rownum, 0]))
-                # Warn if there was really nothing close
-                diff = abs(sim_data[indvar][sim_row] - exp_data.data[rownum, 0])
-                if diff > 1. and diff / exp_data.data[rownum, 0] > 0.1:
-                    warnstr = indvar + str(exp_data.data[rownum, 0])  # An identifier so we only print the warning once
-                    if show_warnings and warnstr not in self.warned:
-                        print1("Warning: For exp point %s=%s, used sim data at %s=%s" %
-                               (indvar, exp_data.data[rownum, 0], indvar, sim_data[indvar][sim_row]))
-                        self.warned.add(warnstr)
-            else:
-                raise PybnfError('Possible values for ind_var_rounding are 0 or 1.')
-
-            for col_name in compare_cols:
-                if np.isnan(exp_data.data[rownum, exp_data.cols[col_name]]):
-                    continue
+        # Match each experimental row to a simulation row, all at once. The per-row argmax/argmin over the
+        # simulation column was the dominant cost of scoring a result.
+        sim_t = np.asarray(sim_data[indvar])
+        exp_t = exp_data.data[:, 0]
+        if self.rounding == 0:
+            # Find the row number of sim_data column 0 that is almost equal to exp_data[rownum, 0]
+            close = np.isclose(sim_t[np.newaxis, :], exp_t[:, np.newaxis], atol=0.)
+            sim_rows = np.argmax(close, axis=1)
+            # If no such row existed, argmax gives 0; rows with no match are skipped.
+            matched = close[np.arange(exp_t.size), sim_rows]
+            for rownum in np.nonzero(~matched)[0]:
+                warnstr = indvar + str(exp_data.data[rownum, 0])  # An identifier so we only print the warning once
+                if show_warnings and warnstr not in self.warned:
+                    print1("Warning: Ignored " + indvar + " " + str(exp_data.data[rownum, 0]) +
+                           " because that " + indvar + " was not in the simulation data.")
+                    self.warned.add(warnstr)
+        elif self.rounding == 1:
+            # Take the closest row to the exp data
+            sim_rows = np.argmin(np.abs(sim_t[np.newaxis, :] - exp_t[:, np.newaxis]), axis=1)
+            matched = np.ones(exp_t.size, dtype=bool)
+            # Warn if there was really nothing close
+            diff = np.abs(sim_t[sim_rows] - exp_t)
+            bad = diff > 1.
+            bad[bad] = diff[bad] / exp_t[bad] > 0.1
+            for rownum in np.nonzero(bad)[0]:
+                warnstr = indvar + str(exp_data.data[rownum, 0])  # An identifier so we only print the warning once
+                if show_warnings and warnstr not in self.warned:
+                    print1("Warning: For exp point %s=%s, used sim data at %s=%s" %
+                           (indvar, exp_data.data[rownum, 0], indvar, sim_t[sim_rows[rownum]]))
+                    self.warned.add(warnstr)
+        else:
+            raise PybnfError('Possible values for ind_var_rounding are 0 or 1.')
+
+        exp_rows = np.nonzero(matched)[0]
+        sim_rows = sim_rows[matched]
 
-                cur_sim_val = sim_data.data[sim_row, sim_data.cols[col_name]]
-
-                if np.isnan(cur_sim_val) or np.isinf(cur_sim_val):
-                    return None
-                func_value += self.eval_point(sim_data, exp_data, sim_row, rownum, col_name) \
-                    * exp_data.weights[rownum, exp_data.cols[col_name]]
+        func_value = 0.0
+        for col_name in compare_cols:
+            # Skip points where the experimental value is NaN (missing data)
+            use = ~np.isnan(exp_data.data[exp_rows, exp_data.cols[col_name]])
+            sim_vals = sim_data.data[sim_rows[use], sim_data.cols[col_name]]
+            if np.any(np.isnan(sim_vals)) or np.any(np.isinf(sim_vals)):
+                return None
+            values = self.eval_points(sim_data, exp_data, sim_rows[use], exp_rows[use], col_name)
+            func_value += np.sum(values * exp_data.weights[exp_rows[use], exp_data.cols[col_name]])
 
         return func_value
 
-    def eval_point(self, sim_data, exp_data, sim_row, exp_row, col_name):
+    def eval_points(self, sim_data, exp_data, sim_rows, exp_rows, col_name):
         """
-        Calculate the objective function for a single point in the data
+        Calculate the objective function for one column of the data, over all compared points at once
 
         This evaluation is what differentiates the different objective functions.
 
         :param sim_data: The simulation Data object
         :param exp_data: The experimental Data object
-        :param sim_row: The row number to look at in sim_data
-        :param exp_row: The row number to look at in exp_data
+        :param sim_rows: Array of row numbers to look at in sim_data
+        :param exp_rows: Array of the corresponding row numbers in exp_data
         :param col_name: The column name to look at  (same for the sim_data and the exp_data)
-        :return:
+        :return: 1D ndarray with the objective contribution of each point, before weighting
         """
-        raise NotImplementedError('Subclasses of SummationObjective must override eval_point')
+        raise NotImplementedError('Subclasses of SummationObjective must override eval_points')
 
     def _check_columns(self, exp_cols, compare_cols):
         """
@@ -199,9 +204,9 @@ class SummationObjective(ObjectiveFunction):
 
 class ChiSquareObjective(SummationObjective):
 
-    def eval_point(self, sim_data, exp_data, sim_row, exp_row, col_name):
-        sim_val = sim_data.data[sim_row, sim_data.cols[col_name]]
-        exp_val = exp_data.data[exp_row, exp_data.cols[col_name]]
+    def eval_points(self, sim_data, exp_data, sim_rows, exp_rows, col_name):
+        sim_vals = sim_data.data[sim_rows, sim_data.cols[col_name]]
+        exp_vals = exp_data.data[exp_rows, exp_data.cols[col_name]]
         try:
             # Todo: Check for this and throw the error before all the workers get created.
             sd_col = exp_data.cols[col_name + '_SD']
@@ -210,8 +215,8 @@ class ChiSquareObjective(SummationObjective):
                  "Column %s_SD was not found in the experimental data. When using the chi_sq objective function, your "
                  "data file must include a _SD column corresponding to each experimental variable, giving the standard "
                  "deviations of that variable. " % col_name)
-        exp_sigma = exp_data.data[exp_row, sd_col]
-        return 1. / (2. * exp_sigma ** 2.) * (sim_val - exp_val) ** 2.
+        exp_sigma = exp_data.data[exp_rows, sd_col]
+        return 1. / (2. * exp_sigma ** 2.) * (sim_vals - exp_vals) ** 2.
 
     def  _check_columns(self, exp_cols, compare_cols):
         """
@@ -230,29 +235,29 @@ class ChiSquareObjective(SummationObjective):
 
 class SumOfSquaresObjective(SummationObjective):
 
-    def eval_point(self, sim_data, exp_data, sim_row, exp_row, col_name):
+    def eval_points(self, sim_data, exp_data, sim_rows, exp_rows, col_name):
 
-        sim_val = sim_data.data[sim_row, sim_data.cols[col_name]]
-        exp_val = exp_data.data[exp_row, exp_data.cols[col_name]]
-        return (sim_val - exp_val) ** 2.
+        sim_vals = sim_data.data[sim_rows, sim_data.cols[col_name]]
+        exp_vals = exp_data.data[exp_rows, exp_data.cols[col_name]]
+        return (sim_vals - exp_vals) ** 2.
 
 class SumOfDiffsObjective(SummationObjective):
 
-    def eval_point(self, sim_data, exp_data, sim_row, exp_row, col_name):
+    def eval_points(self, sim_data, exp_data, sim_rows, exp_rows, col_name):
 
-        sim_val = sim_data.data[sim_row, sim_data.cols[col_name]]
-        exp_val = exp_data.data[exp_row, exp_data.cols[col_name]]
-        return abs(sim_val - exp_val)
+        sim_vals = sim_data.data[sim_rows, sim_data.cols[col_name]]
+        exp_vals = exp_data.data[exp_rows, exp_data.cols[col_name]]
+        return np.abs(sim_vals - exp_vals)
 
 class NormSumOfSquaresObjective(SummationObjective):
     """
     Sum of squares where each point is normalized by the y value at that point, ((y-y')/y)^2
     """
-    def eval_point(self, sim_data, exp_data, sim_row, exp_row, col_name):
+    def eval_points(self, sim_data, exp_data, sim_rows, exp_rows, col_name):
 
-        sim_val = sim_data.data[sim_row, sim_data.cols[col_name]]
-        exp_val = exp_data.data[exp_row, exp_data.cols[col_name]]
-        return ((sim_val - exp_val)/exp_val) ** 2.
+        sim_vals = sim_data.data[sim_rows, sim_data.cols[col_name]]
+        exp_vals = exp_data.data[exp_rows, exp_data.cols[col_name]]
+        return ((sim_vals - exp_vals)/exp_vals) ** 2.
 
 
 class AveNormSumOfSquaresObjective(SummationObjective):
@@ -265,10 +270,10 @@ class AveNormSumOfSquaresObjective(SummationObjective):
         self.aves = {name: np.average(exp_data[name]) for name in exp_data.cols}
         return super().evaluate(sim_data, exp_data, show_warnings)
 
-    def eval_point(self, sim_data, exp_data, sim_row, exp_row, col_name):
-        sim_val = sim_data.data[sim_row, sim_data.cols[col_name]]
-        exp_val = exp_data.data[exp_row, exp_data.cols[col_name]]
-        return ((sim_val - exp_val) / self.aves[col_name]) ** 2.
+    def eval_points(self, sim_data, exp_data, sim_rows, exp_rows, col_name):
+        sim_vals = sim_data.data[sim_rows, sim_data.cols[col_name]]
+        exp_vals = exp_data.data[exp_rows, exp_data.cols[col_name]]
+        return ((sim_vals - exp_vals) / self.aves[col_name]) ** 2.
 
 
 class ConstraintCounter(ObjectiveFunction):
@@ -1044,6 +1044,24 @@ class FreeParameter(object):
             val = self._distribution(self.p1, self.p2)
         return self.set_value(val)
 
+    def sample_values(self, n):
+        """
+        Samples n values for this parameter based on its defined initial distribution.
+        Equivalent to n calls of sample_value(), but draws all the random numbers in a single vectorized call.
+
+        :param n: Number of values to sample
+        :type n: int
+        :return: list of n new FreeParameter instances
+        """
+        if self.log_space:
+            if re.fullmatch('lognormal_var', self.type):
+                vals = 10**(self._distribution(self.p1, self.p2, size=n))
+            else:
+                vals = 10**(self._distribution(np.log10(self.p1), np.log10(self.p2), size=n))
+        else:
+            vals = self._distribution(self.p1, self.p2, size=n)
+        return [self.set_value(v) for v in vals]
+
     def add(self, summand, reflect=True):
         """
         Adds a value to the existing value and returns a new FreeParameter instance.  Since free parameters
@@ -1288,6 +1306,30 @@ class Trajectory(object):
                     af.write(self._traj_write_header())
                 af.write(self._traj_entry_format((-obj, name, pset)))
 
+    def add_many(self, entries):
+        """
+        Adds a batch of PSets to the fitting trajectory in a single call
+
+        Amortizes the per-item bookkeeping of add() over the whole batch: the PSet compatibility check is done
+        once, against the first entry.
+
+        :param entries: Iterable of tuples (pset, obj, name)
+        """
+        entries = list(entries)
+        if len(entries) == 0:
+            return
+        if len(self._trajectory) > 0 and not self._valid_pset(entries[0][0]):
+            raise ValueError("PSet %s has incompatible parameters" % entries[0][0])
+        trajectory = self._trajectory
+        max_output = self.max_output
+        for pset, obj, name in entries:
+            if np.isnan(obj):
+                obj = np.inf
+            if len(trajectory) < max_output:
+                heapq.heappush(trajectory, (-obj, name, pset))
+            else:
+                heapq.heappushpop(trajectory, (-obj, name, pset))
+
     def _traj_write_header(self):
         header = self._trajectory[0][2].keys_to_string()
         return '#\tSimulation\tObj\t%s\n' % header
@@ -51,6 +51,16 @@ class TestFreeParameter:
         p0s = self.p0.sample_value()
         assert p0s.value is not None
 
+    def test_sample_values(self):
+        p3s = self.p3.sample_values(1000)
+        assert len(p3s) == 1000
+        for p in p3s:
+            assert p.value is not None
+            assert self.p3.lower_bound <= p.value < self.p3.upper_bound
+        p2s = self.p2.sample_values(1000)
+        for p in p2s:
+            assert self.p2.lower_bound <= p.value <= self.p2.upper_bound
+
     def test_freeparameter_equality(self):
         p6 = self.p0.sample_value()
         p0s = self.p0.set_value(p6.value)
@@ -1,4 +1,5 @@
 from .context import data, algorithms, pset, objective, config, parse
+import numpy as np
 import numpy.testing as npt
 from os import mkdir, path
 from shutil import rmtree
@@ -35,6 +36,13 @@ class TestParticleSwarm:
         cls.d2s = data.Data()
         cls.d2s.data = cls.d2s._read_file_lines(cls.data2s, '\s+')
 
+        cls.data3s = [
+            '# time    v1_result    v2_result    v3_result\n',
+            ' 1 5.0   6.0   9.0\n',
+        ]
+        cls.d3s = data.Data()
+        cls.d3s.data = cls.d3s._read_file_lines(cls.data3s, '\s+')
+
         cls.variables = ['v1__FREE', 'v2__FREE', 'v3__FREE']
 
         cls.chi_sq = objective.ChiSquareObjective()
@@ -102,15 +110,29 @@ class TestParticleSwarm:
         new_result = algorithms.Result(next_params[7], self.d1s, 'sim_1')
         new_result.score = ps.objective.evaluate(self.d1s, self.d1e)
         ps.got_result(new_result)  # better than the previous ones
+        # The particle's own best updates right away, but the swarm-wide best waits for the pseudoflight boundary
+        assert np.array_equal(ps.bests_pos[7], ps._pset_to_array(next_params[7]))
+        assert ps.global_best[0] in start_params
+        assert ps.score_history[15] == new_result.score
+        assert np.all(np.isnan(ps.score_history[16:]))
+
+        # Finish the pseudoflight with strictly worse results; the boundary refresh should pick up the new best
+        for i in range(15):
+            if i == 7:
+                continue
+            new_result = algorithms.Result(next_params[i], self.d3s, 'sim_1')
+            new_result.score = ps.objective.evaluate(self.d3s, self.d1e)
+            ps.got_result(new_result)
         assert ps.global_best[0] == next_params[7]
 
         # Exactly 1 individual particle should have its best as that global best, the rest should be one of start_params
         count = 0
+        start_rows = [ps._pset_to_array(sp) for sp in start_params]
         for i in range(15):
-            if ps.bests[i][0] == next_params[7]:
+            if np.array_equal(ps.bests_pos[i], ps._pset_to_array(next_params[7])):
                 count += 1
             else:
-                assert ps.bests[i][0] in start_params
+                assert any(np.array_equal(ps.bests_pos[i], row) for row in start_rows)
         assert count == 1
 
     def test_latin_hypercube(self):
@@ -118,6 +140,6 @@ class TestParticleSwarm:
         ps.start_run()
         for i in range(10):
             # Latin hypercube should distribute starting values evenly (one in each bin) in each dimension.
-            assert len([x for x in ps.swarm if i < x[0]['v1__FREE'] < i+1]) == 1
+            assert len([x for x in ps.particles if i < x['v1__FREE'] < i+1]) == 1
 
 
@@ -86,6 +86,25 @@ class TestTrajectory:
         assert traj.best_fit() == self.ps0
         assert traj.best_fit_name() == 'p0'
 
+    def test_add_many(self):
+        traj = pset.Trajectory(2)
+        traj.add_many([(self.ps0, self.obj0, 'p0'), (self.ps1, self.obj1, 'p1'), (self.ps2, self.obj2, 'p2'),
+                       (self.ps3, self.obj3, 'p3')])
+        # Should be equivalent to the same sequence of add() calls: capped at max_output, NaN counted as inf
+        ref = pset.Trajectory(2)
+        ref.add(self.ps0, self.obj0, 'p0')
+        ref.add(self.ps1, self.obj1, 'p1')
+        ref.add(self.ps2, self.obj2, 'p2')
+        ref.add(self.ps3, self.obj3, 'p3')
+        assert sorted(traj._trajectory) == sorted(ref._trajectory)
+        assert traj._write() == '#\tSimulation\tObj\tx\ty\tz\n\tp0\t0.0\t1.0\t2.0\t3.14\n\tp1\t1.0\t3.0\t700.3\t0.00052\n'
+
+    @raises(Exception)
+    def test_add_many_incompatible_psets(self):
+        traj = pset.Trajectory(1000000)
+        traj.add(self.ps0, self.obj0, 'p0')
+        traj.add_many([(self.ps4, self.obj2, 'p4')])
+
     def test_max_output(self):
         traj = pset.Trajectory(2)
         traj.add(self.ps0, self.obj0, 'p0')